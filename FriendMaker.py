@@ -2,18 +2,24 @@ import discord
 from discord import app_commands
 from discord.ui import Select, View, Modal, TextInput, Button
 from discord.ext import tasks
-from datetime import datetime, time, date, timezone, timedelta
+from datetime import datetime, timedelta
 import asyncio
 import os
 import sqlite3
 import json
+import hashlib
+from time_parser import KST, parse_time_string_to_datetime, parse_recruitment_end_datetime, format_kst_datetime
 
 BOT_TOKEN = "" 
 GUILD_ID = 
 DB_NAME = "FriendMaker.db"
 
-# [추가] 한국 시간대(KST) 정의
-KST = timezone(timedelta(hours=9))
+# 다중 참여 선택 메뉴는 한 줄을 통째로 차지하므로, 버튼이 4줄(20개)을 넘으면 추가할 수 없음
+MAX_GAMES_FOR_JOIN_SELECT = 20
+
+# 공지 재동기화(reconciliation) 설정 - 재시작 직후 API 폭주를 막기 위해 동시 수정 수와 간격을 제한
+RECONCILE_CONCURRENCY = 3
+RECONCILE_EDIT_INTERVAL = 1.0
 
 # 인텐트 설정
 intents = discord.Intents.default()
@@ -39,8 +45,13 @@ def init_db():
     CREATE TABLE IF NOT EXISTS civil_wars (
         war_id INTEGER PRIMARY KEY, host_id INTEGER NOT NULL, start_datetime TEXT NOT NULL,
         games_list TEXT NOT NULL, description TEXT, message_id INTEGER, channel_id INTEGER,
-        recruitment_end_datetime TEXT, is_recruiting INTEGER NOT NULL DEFAULT 1
+        recruitment_end_datetime TEXT, is_recruiting INTEGER NOT NULL DEFAULT 1,
+        notice_render_hash TEXT
     )""")
+    # 이전 버전 DB에는 notice_render_hash 컬럼이 없으므로 추가
+    cursor.execute("PRAGMA table_info(civil_wars)")
+    if "notice_render_hash" not in {row[1] for row in cursor.fetchall()}:
+        cursor.execute("ALTER TABLE civil_wars ADD COLUMN notice_render_hash TEXT")
     cursor.execute("""
     CREATE TABLE IF NOT EXISTS participants (
         war_id INTEGER NOT NULL, user_id INTEGER NOT NULL, game_name TEXT NOT NULL,
@@ -65,49 +76,40 @@ def init_db():
 def get_db_connection():
     return sqlite3.connect(DB_NAME)
 
-# --- [수정된 부분] 시간 파싱 함수 ---
-def parse_time_string(time_str: str) -> time | None:
-    try:
-        # strptime으로 생성된 naive time 객체에 KST 시간대 정보를 추가
-        return datetime.strptime(time_str, "%H:%M").time().replace(tzinfo=KST)
-    except ValueError:
-        try:
-            if "시" in time_str:
-                parts = time_str.replace("오후", "").replace("오전", "").replace(" ", "").split("시")
-                hour = int(parts[0])
-                minute = 0
-                if "분" in parts[1]:
-                    minute = int(parts[1].replace("분", ""))
-                
-                if "오후" in time_str and hour < 12:
-                    hour += 12
-                elif "오전" in time_str and hour == 12: 
-                    hour = 0
-                # time 객체 생성 시 KST 시간대 정보를 직접 포함
-                return time(hour, minute, tzinfo=KST)
-            elif ":" in time_str:
-                 hour, minute = map(int, time_str.split(':'))
-                 # time 객체 생성 시 KST 시간대 정보를 직접 포함
-                 return time(hour, minute, tzinfo=KST)
-        except Exception:
-            return None
-    return None
-
-def parse_time_string_to_datetime(time_str: str, reference_date: date | None = None) -> datetime | None:
-    parsed_time = parse_time_string(time_str)
-    if parsed_time:
-        # 현재 날짜도 KST 기준으로 가져옴
-        today_kst = datetime.now(KST).date()
-        target_date = reference_date if reference_date else today_kst
-        
-        # 이제 parsed_time이 aware 객체이므로, dt_obj도 aware 객체가 됨
-        dt_obj = datetime.combine(target_date, parsed_time)
-        
-        # 비교 대상인 datetime.now(KST)도 aware 객체이므로 정상적으로 비교 가능
-        if not reference_date and dt_obj < datetime.now(KST):
-            dt_obj += timedelta(days=1)
-        return dt_obj
-    return None
+TIME_AUTOCOMPLETE_EXAMPLES = ["오늘 오후 9시", "내일 오후 9시 30분", "토요일 21:00", "다음 주 금요일 오후 8시"]
+# 날짜만 입력 중일 때 미리보기에 붙여 보여줄 기본 시각
+TIME_AUTOCOMPLETE_DEFAULT_TIME = "오후 9시"
+
+def build_time_choices(candidates: list[str], resolve) -> list[app_commands.Choice[str]]:
+    choices = []
+    for candidate in candidates:
+        resolved = resolve(candidate)
+        if resolved:
+            choices.append(app_commands.Choice(name=f"{candidate} → {format_kst_datetime(resolved)}"[:100], value=candidate[:100]))
+            continue
+        # "토요일", "12/25"처럼 시각이 빠진 입력은 기본 시각을 붙인 후보를 제안
+        suggested = f"{candidate.strip()} {TIME_AUTOCOMPLETE_DEFAULT_TIME}"
+        resolved = resolve(suggested)
+        if resolved:
+            choices.append(app_commands.Choice(name=f"{suggested} → {format_kst_datetime(resolved)} (시각을 함께 입력하세요)"[:100], value=suggested[:100]))
+    if not choices and candidates:
+        choices.append(app_commands.Choice(name="시각을 함께 입력하세요 (예: 토요일 오후 9시, 12/25 21:00)", value=candidates[0][:100]))
+    return choices[:25]
+
+async def war_time_autocomplete(interaction: discord.Interaction, current: str) -> list[app_commands.Choice[str]]:
+    candidates = [current] if current.strip() else TIME_AUTOCOMPLETE_EXAMPLES
+    return build_time_choices(candidates, parse_time_string_to_datetime)
+
+async def recruitment_end_time_autocomplete(interaction: discord.Interaction, current: str) -> list[app_commands.Choice[str]]:
+    # 이미 입력된 시작 시간을 기준으로 실제 /내전생성과 같은 방식으로 미리보기
+    start_input = getattr(interaction.namespace, "시작시간", None)
+    start_datetime = parse_time_string_to_datetime(start_input) if start_input else None
+    candidates = [current] if current.strip() else TIME_AUTOCOMPLETE_EXAMPLES
+    return build_time_choices(candidates, lambda candidate: parse_recruitment_end_datetime(candidate, start_datetime))
+
+def compute_notice_render_hash(embed: discord.Embed, view_disabled: bool) -> str:
+    payload = json.dumps({"embed": embed.to_dict(), "view_disabled": view_disabled}, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
 async def create_civil_war_games_autocomplete(interaction: discord.Interaction, current: str) -> list[app_commands.Choice[str]]:
     choices = []
@@ -128,7 +130,7 @@ async def create_civil_war_games_autocomplete(interaction: discord.Interaction,
 class CivilWarInfo:
     def __init__(self, war_id, host_id, start_datetime: datetime, games_list, description, 
                  message_id, channel_id, recruitment_end_datetime: datetime | None, 
-                 is_recruiting: bool = True):
+                 is_recruiting: bool = True, notice_render_hash: str | None = None):
         self.war_id = war_id
         self.host_id = host_id
         self.start_datetime = start_datetime
@@ -142,6 +144,7 @@ class CivilWarInfo:
         self.is_recruiting = is_recruiting 
         self.recruitment_end_datetime = recruitment_end_datetime
         self.reminder_sent_users = set()
+        self.notice_render_hash = notice_render_hash
 
     async def load_participants_from_db(self):
         conn = get_db_connection()
@@ -165,6 +168,53 @@ class CivilWarInfo:
             self.reminder_sent_users.add(row[0])
         conn.close()
 
+    def close_recruitment(self):
+        self.is_recruiting = False
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        cursor.execute("UPDATE civil_wars SET is_recruiting = 0 WHERE war_id = ?", (self.war_id,))
+        conn.commit()
+        conn.close()
+
+    def mark_notice_published(self, published_embed: discord.Embed):
+        # 마지막으로 게시한 공지 상태(임베드 + 버튼 비활성화 여부)를 해시로 기록
+        self.notice_render_hash = compute_notice_render_hash(published_embed, not self.is_recruiting)
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        cursor.execute("UPDATE civil_wars SET notice_render_hash = ? WHERE war_id = ?", (self.notice_render_hash, self.war_id))
+        conn.commit()
+        conn.close()
+
+    def join_games(self, user_id: int, game_names: list[str]) -> tuple[list[str], list[str], list[str]]:
+        # 여러 게임 참여를 한 번의 트랜잭션으로 반영 -> (신규 참여, 불참 취소 후 재참여, 이미 참여 중) 게임 목록 반환
+        joined_games, rejoined_games, already_joined_games = [], [], []
+        user_games = self.participants.setdefault(user_id, set())
+        user_absences = self.absent_participants.get(user_id, {})
+
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        for game_name in game_names:
+            if game_name in user_absences:
+                del user_absences[game_name]
+                cursor.execute("DELETE FROM absent_participants WHERE war_id=? AND user_id=? AND game_name=?", (self.war_id, user_id, game_name))
+                rejoined_games.append(game_name)
+            elif game_name in user_games:
+                already_joined_games.append(game_name)
+                continue
+            else:
+                joined_games.append(game_name)
+            user_games.add(game_name)
+            cursor.execute("INSERT OR IGNORE INTO participants (war_id, user_id, game_name) VALUES (?,?,?)", (self.war_id, user_id, game_name))
+        conn.commit()
+        conn.close()
+
+        if user_id in self.absent_participants and not self.absent_participants[user_id]:
+            del self.absent_participants[user_id]
+        return joined_games, rejoined_games, already_joined_games
+
+    def has_join_select(self) -> bool:
+        return 1 < len(self.games_list) <= MAX_GAMES_FOR_JOIN_SELECT
+
     def get_participant_count_for_game(self, game_name_to_check: str) -> int:
         count = 0
         for user_id, selected_games_set in self.participants.items():
@@ -238,12 +288,76 @@ class CivilWarInfo:
         
         footer_text = f"내전 ID: {self.war_id}"
         if is_currently_recruiting:
-            footer_text += " | 아래 버튼으로 참여, 불참은 /내전불참 명령어 사용"
+            join_hint = "아래 버튼 또는 선택 메뉴로 참여" if self.has_join_select() else "아래 버튼으로 참여"
+            footer_text += f" | {join_hint}, 불참은 /내전불참 명령어 사용"
         else:
             footer_text += " | 모집이 종료되었습니다."
         embed.set_footer(text=footer_text)
         return embed
 
+async def reject_if_recruitment_closed(interaction: discord.Interaction, live_war_info: CivilWarInfo | None) -> bool:
+    current_time = datetime.now(KST)
+    recruitment_ended = live_war_info and live_war_info.recruitment_end_datetime and live_war_info.recruitment_end_datetime <= current_time
+
+    if live_war_info and live_war_info.is_recruiting and not recruitment_ended:
+        return False
+
+    if live_war_info and live_war_info.is_recruiting:
+        live_war_info.close_recruitment()
+        print(f"참여 시도 중 내전 ID {live_war_info.war_id}의 모집 상태를 종료로 수정했습니다.")
+    
+    await interaction.response.send_message("모집이 종료되었거나 만료된 내전입니다.", ephemeral=True)
+    
+    try: 
+        view = View.from_message(interaction.message)
+        if view:
+            for child in view.children:
+                if isinstance(child, (Button, Select)): child.disabled = True
+            updated_embed = live_war_info.get_embed(interaction.client) 
+            await interaction.message.edit(embed=updated_embed, view=view)
+            live_war_info.mark_notice_published(updated_embed)
+    except Exception: pass
+    return True
+
+class GamesToJoinSelect(Select):
+    def __init__(self, war_info: CivilWarInfo):
+        self.war_id = war_info.war_id
+        options = [discord.SelectOption(label=game_name[:100], value=game_name, emoji='🕹️') for game_name in war_info.games_list[:25]]
+        super().__init__(placeholder="여러 게임에 한 번에 참여하기 (다중 선택 가능)", min_values=1, max_values=len(options),
+                         options=options, custom_id=f"join_multi:{war_info.war_id}")
+
+    async def callback(self, interaction: discord.Interaction):
+        live_war_info = active_civil_wars.get(self.war_id)
+        if await reject_if_recruitment_closed(interaction, live_war_info):
+            return
+
+        selected_games = [game_name for game_name in self.values if game_name in live_war_info.games_list]
+        joined_games, rejoined_games, already_joined_games = live_war_info.join_games(interaction.user.id, selected_games)
+
+        feedback_lines = []
+        if joined_games:
+            feedback_lines.append(f"'{', '.join(joined_games)}' 내전에 참여의사를 밝혔습니다 😊")
+        if rejoined_games:
+            feedback_lines.append(f"'{', '.join(rejoined_games)}' 게임 불참을 취소하고 다시 참여했습니다 ☺️")
+        if already_joined_games:
+            feedback_lines.append(f"이미 '{', '.join(already_joined_games)}' 내전에 참여 중입니다. 참여를 취소하려면 `/내전불참` 명령어를 사용해주세요.")
+
+        if not joined_games and not rejoined_games:
+            await interaction.response.send_message("\n".join(feedback_lines) or "선택한 게임이 없습니다.", ephemeral=True)
+            return
+
+        # 공지 수정과 상호작용 응답을 한 번의 호출로 처리하고, 선택 상태도 초기화
+        try:
+            updated_embed = live_war_info.get_embed(interaction.client)
+            await interaction.response.edit_message(embed=updated_embed, view=self.view)
+            live_war_info.mark_notice_published(updated_embed)
+        except Exception as e:
+            print(f"다중 참여 선택에서 임베드 업데이트 실패 (war_id: {live_war_info.war_id}): {e}")
+        if interaction.response.is_done():
+            await interaction.followup.send("\n".join(feedback_lines), ephemeral=True)
+        else:
+            await interaction.response.send_message("\n".join(feedback_lines), ephemeral=True)
+
 class CivilWarActionView(View):
     def __init__(self, war_info: CivilWarInfo):
         super().__init__(timeout=None)
@@ -255,6 +369,8 @@ class CivilWarActionView(View):
             )
             button.callback = self.button_callback
             self.add_item(button)
+        if war_info.has_join_select():
+            self.add_item(GamesToJoinSelect(war_info))
 
     async def button_callback(self, interaction: discord.Interaction):
         custom_id_parts = interaction.data['custom_id'].split(':')
@@ -262,88 +378,37 @@ class CivilWarActionView(View):
         game_name = custom_id_parts[2]
 
         live_war_info = active_civil_wars.get(war_id_from_button)
-        
-        current_time = datetime.now(KST)
-        recruitment_ended = live_war_info and live_war_info.recruitment_end_datetime and live_war_info.recruitment_end_datetime <= current_time
-
-        if not live_war_info or not live_war_info.is_recruiting or recruitment_ended:
-            if live_war_info and live_war_info.is_recruiting:
-                live_war_info.is_recruiting = False
-                conn = get_db_connection()
-                cursor = conn.cursor()
-                cursor.execute("UPDATE civil_wars SET is_recruiting = 0 WHERE war_id = ?", (live_war_info.war_id,))
-                conn.commit()
-                conn.close()
-                print(f"참여 시도 중 내전 ID {live_war_info.war_id}의 모집 상태를 종료로 수정했습니다.")
-            
-            await interaction.response.send_message("모집이 종료되었거나 만료된 내전입니다.", ephemeral=True)
-            
-            try: 
-                view = View.from_message(interaction.message)
-                if view:
-                    for child in view.children:
-                        if isinstance(child, Button): child.disabled = True
-                    updated_embed = live_war_info.get_embed(interaction.client) 
-                    await interaction.message.edit(embed=updated_embed, view=view)
-            except Exception: pass
+        if await reject_if_recruitment_closed(interaction, live_war_info):
             return
 
-        user_id = interaction.user.id
-        
-        if user_id not in live_war_info.participants:
-            live_war_info.participants[user_id] = set()
-        if user_id not in live_war_info.absent_participants:
-            live_war_info.absent_participants[user_id] = {}
-
-        is_absent = game_name in live_war_info.absent_participants.get(user_id, {})
-        is_participating = game_name in live_war_info.participants.get(user_id, set())
-        
-        feedback_message = ""
-        made_change = False
+        joined_games, rejoined_games, already_joined_games = live_war_info.join_games(interaction.user.id, [game_name])
 
-        conn = get_db_connection()
-        cursor = conn.cursor()
+        if already_joined_games:
+            await interaction.response.send_message(f"이미 '{game_name}' 내전에 참여 중입니다. 참여를 취소하려면 `/내전불참` 명령어를 사용해주세요.", ephemeral=True)
+            return
 
-        if is_absent:
-            del live_war_info.absent_participants[user_id][game_name]
-            if not live_war_info.absent_participants[user_id]:
-                del live_war_info.absent_participants[user_id]
-            cursor.execute("DELETE FROM absent_participants WHERE war_id=? AND user_id=? AND game_name=?", (live_war_info.war_id, user_id, game_name))
-            live_war_info.participants[user_id].add(game_name)
-            cursor.execute("INSERT OR IGNORE INTO participants (war_id, user_id, game_name) VALUES (?,?,?)", (live_war_info.war_id, user_id, game_name))
+        if rejoined_games:
             feedback_message = f"'{game_name}' 게임 불참을 취소하고 다시 참여했습니다 ☺️"
-            made_change = True
-        
-        elif is_participating:
-            await interaction.response.send_message(f"이미 '{game_name}' 내전에 참여 중입니다. 참여를 취소하려면 `/내전불참` 명령어를 사용해주세요.", ephemeral=True)
-        
         else:
-            live_war_info.participants[user_id].add(game_name)
-            cursor.execute("INSERT OR IGNORE INTO participants (war_id, user_id, game_name) VALUES (?,?,?)", (live_war_info.war_id, user_id, game_name))
             feedback_message = f"'{game_name}' 내전에 참여의사를 밝혔습니다 😊"
-            made_change = True
-
-        conn.commit()
-        conn.close()
 
-        if made_change:
-            try:
-                updated_embed = live_war_info.get_embed(interaction.client)
-                await interaction.message.edit(embed=updated_embed)
-            except Exception as e:
-                print(f"버튼 콜백에서 임베드 업데이트 실패 (war_id: {live_war_info.war_id}): {e}")
-        if feedback_message:
-            await interaction.response.send_message(feedback_message, ephemeral=True)
+        try:
+            updated_embed = live_war_info.get_embed(interaction.client)
+            await interaction.message.edit(embed=updated_embed)
+            live_war_info.mark_notice_published(updated_embed)
+        except Exception as e:
+            print(f"버튼 콜백에서 임베드 업데이트 실패 (war_id: {live_war_info.war_id}): {e}")
+        await interaction.response.send_message(feedback_message, ephemeral=True)
 
 # --- 명령어 정의 ---
 @tree.command(name="내전생성", guild=discord.Object(id=GUILD_ID))
 @app_commands.describe(
-    시작시간="내전 시작 시간 (예: 21:00 또는 오후 9시)",
-    모집종료시간="모집 종료 시간 (예: 23:50 또는 오후 11시 50분)",
+    시작시간="내전 시작 시간 (예: 21:00, 오후 9시, 토요일 오후 9시 30분, 12/25 21:00)",
+    모집종료시간="모집 종료 시간 (예: 23:50, 오후 11시 50분, 내일 오후 8시)",
     게임목록="플레이할 게임 (쉼표로 구분, 예: 리그 오브 레전드, 발로란트)",
     상세설명="내전 규칙, 참가 조건 등 상세 내용"
 )
-@app_commands.autocomplete(게임목록=create_civil_war_games_autocomplete)
+@app_commands.autocomplete(시작시간=war_time_autocomplete, 모집종료시간=recruitment_end_time_autocomplete, 게임목록=create_civil_war_games_autocomplete)
 async def create_civil_war(interaction: discord.Interaction, 시작시간: str, 모집종료시간: str, 게임목록: str, 상세설명: str):
     if not 게임목록:
         await interaction.response.send_message("하나 이상의 게임을 입력해야 합니다.", ephemeral=True)
@@ -352,10 +417,20 @@ async def create_civil_war(interaction: discord.Interaction, 시작시간: str,
     if not parsed_start_datetime:
         await interaction.response.send_message(f"(!) 시작 시간 형식이 올바르지 않습니다. (입력값: {시작시간})", ephemeral=True)
         return
-    parsed_recruitment_end_datetime = parse_time_string_to_datetime(모집종료시간)
+    parsed_recruitment_end_datetime = parse_recruitment_end_datetime(모집종료시간, parsed_start_datetime)
     if not parsed_recruitment_end_datetime:
         await interaction.response.send_message(f"(!) 모집 종료 시간 형식이 올바르지 않습니다. (입력값: {모집종료시간})", ephemeral=True)
         return
+    current_time = datetime.now(KST)
+    if parsed_start_datetime <= current_time:
+        await interaction.response.send_message(f"(!) 시작 시간이 이미 지났습니다. (입력값: {시작시간} → {format_kst_datetime(parsed_start_datetime)})", ephemeral=True)
+        return
+    if parsed_recruitment_end_datetime <= current_time:
+        await interaction.response.send_message(f"(!) 모집 종료 시간이 이미 지났습니다. (입력값: {모집종료시간} → {format_kst_datetime(parsed_recruitment_end_datetime)})", ephemeral=True)
+        return
+    if parsed_recruitment_end_datetime > parsed_start_datetime:
+        await interaction.response.send_message(f"(!) 모집 종료 시간은 시작 시간보다 늦을 수 없습니다. (시작: {format_kst_datetime(parsed_start_datetime)}, 모집 종료: {format_kst_datetime(parsed_recruitment_end_datetime)})", ephemeral=True)
+        return
 
     input_games_original_case = [game.strip() for game in 게임목록.split(',') if game.strip()]
     input_games_lower_case_set = {game.lower() for game in input_games_original_case}
@@ -413,6 +488,7 @@ async def create_civil_war(interaction: discord.Interaction, 시작시간: str,
     cursor.execute("UPDATE civil_wars SET message_id = ? WHERE war_id = ?", (original_message.id, war_info.war_id))
     conn.commit()
     conn.close()
+    war_info.mark_notice_published(initial_embed)
     print(f"내전 생성됨 (DB 저장): ID {war_info.war_id}, 게임: {input_games_original_case}")
 
 @tree.command(name="내전삭제", guild=discord.Object(id=GUILD_ID))
@@ -584,6 +660,7 @@ class AbsenseReasonModal(Modal):
             if original_message:
                 updated_embed = live_war_info.get_embed(client) 
                 await original_message.edit(embed=updated_embed)
+                live_war_info.mark_notice_published(updated_embed)
             await interaction.response.send_message(content=feedback_msg, ephemeral=True)
         except Exception as e:
             print(f"불참 처리 중 오류 (war_id: {live_war_info.war_id}): {e}")
@@ -596,12 +673,7 @@ async def check_recruitment_end_task():
     for war_id, war_info in list(active_civil_wars.items()): 
         if war_info.is_recruiting and war_info.recruitment_end_datetime:
             if now >= war_info.recruitment_end_datetime:
-                war_info.is_recruiting = False
-                conn = get_db_connection()
-                cursor = conn.cursor()
-                cursor.execute("UPDATE civil_wars SET is_recruiting = 0 WHERE war_id = ?", (war_id,))
-                conn.commit()
-                conn.close()
+                war_info.close_recruitment()
                 print(f"내전 ID {war_id} 모집 자동 종료 (DB 업데이트됨).")
                 if war_info.message:
                     try:
@@ -611,6 +683,7 @@ async def check_recruitment_end_task():
                             for item in view.children:
                                 item.disabled = True
                         await war_info.message.edit(embed=updated_embed, view=view) 
+                        war_info.mark_notice_published(updated_embed)
                     except Exception as e:
                         print(f"내전 ID {war_id} 공지(모집종료) 업데이트 중 오류: {e}")
 
@@ -643,6 +716,56 @@ async def check_war_start_reminders():
                             except Exception as e:
                                 print(f"DM 알림 발송 중 오류: User ID {user_id}, 내전 ID {war_id} - {e}")
 
+async def reconcile_war_notice(war_info: CivilWarInfo, semaphore: asyncio.Semaphore):
+    if not war_info.message_id or not war_info.channel_id:
+        return
+    channel = client.get_channel(war_info.channel_id)
+    if not channel:
+        return
+
+    async with semaphore:
+        # 대기 중에 참여/삭제가 반영될 수 있으므로 수정 직전에 기대 상태를 계산
+        if active_civil_wars.get(war_info.war_id) is not war_info:
+            return
+        now = datetime.now(KST)
+        if war_info.is_recruiting and war_info.recruitment_end_datetime and war_info.recruitment_end_datetime <= now:
+            war_info.close_recruitment()
+            print(f"공지 재동기화 중 내전 ID {war_info.war_id}의 모집 상태를 종료로 수정했습니다.")
+
+        expected_embed = war_info.get_embed(client)
+        expected_hash = compute_notice_render_hash(expected_embed, not war_info.is_recruiting)
+        if expected_hash == war_info.notice_render_hash:
+            return
+
+        view = CivilWarActionView(war_info)
+        if not war_info.is_recruiting:
+            for item in view.children:
+                item.disabled = True
+        # 메시지를 다시 조회(fetch)하지 않고 PartialMessage로 바로 수정, 429 재시도는 discord.py가 처리
+        message = war_info.message or channel.get_partial_message(war_info.message_id)
+        try:
+            await message.edit(embed=expected_embed, view=view)
+            war_info.mark_notice_published(expected_embed)
+            print(f"내전 ID {war_info.war_id} 공지 재동기화 완료.")
+        except (discord.NotFound, discord.Forbidden) as e:
+            # 삭제되었거나 접근할 수 없는 공지는 상태가 다시 바뀔 때까지 (재시작 후에도) 재시도하지 않음
+            war_info.mark_notice_published(expected_embed)
+            print(f"내전 ID {war_info.war_id} 공지를 수정할 수 없습니다: {e}")
+        except discord.HTTPException as e:
+            print(f"내전 ID {war_info.war_id} 공지 재동기화 중 오류: {e}")
+        await asyncio.sleep(RECONCILE_EDIT_INTERVAL)
+
+@tasks.loop(minutes=10.0)
+async def reconcile_war_notices_task():
+    semaphore = asyncio.Semaphore(RECONCILE_CONCURRENCY)
+    results = await asyncio.gather(
+        *(reconcile_war_notice(war_info, semaphore) for war_info in list(active_civil_wars.values())),
+        return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            print(f"공지 재동기화 작업 중 오류: {result}")
+
 @client.event
 async def on_ready():
     global next_war_id, active_civil_wars
@@ -650,11 +773,11 @@ async def on_ready():
     print("데이터베이스 초기화 완료.")
     conn = get_db_connection()
     cursor = conn.cursor()
-    cursor.execute("SELECT war_id, host_id, start_datetime, games_list, description, message_id, channel_id, recruitment_end_datetime, is_recruiting FROM civil_wars")
+    cursor.execute("SELECT war_id, host_id, start_datetime, games_list, description, message_id, channel_id, recruitment_end_datetime, is_recruiting, notice_render_hash FROM civil_wars")
     loaded_wars_count = 0
     max_db_war_id = 0
     for row in cursor.fetchall():
-        war_id, host_id, start_dt_str, games_json, desc, msg_id, chan_id, rec_end_dt_str, is_rec = row
+        war_id, host_id, start_dt_str, games_json, desc, msg_id, chan_id, rec_end_dt_str, is_rec, render_hash = row
         
         start_dt = datetime.fromisoformat(start_dt_str).astimezone(KST)
         rec_end_dt = datetime.fromisoformat(rec_end_dt_str).astimezone(KST) if rec_end_dt_str else None
@@ -666,7 +789,9 @@ async def on_ready():
         if actual_is_recruiting and rec_end_dt and rec_end_dt <= current_time:
             actual_is_recruiting = False
 
-        war = CivilWarInfo(war_id, host_id, start_dt, games, desc, msg_id, chan_id, rec_end_dt, actual_is_recruiting)
+        war = CivilWarInfo(war_id, host_id, start_dt, games, desc, msg_id, chan_id, rec_end_dt, actual_is_recruiting, render_hash)
+        if bool(is_rec) and not actual_is_recruiting:
+            war.close_recruitment()
         await war.load_participants_from_db() 
         if war.message_id and war.channel_id:
             try:
@@ -704,6 +829,9 @@ async def on_ready():
         if not check_war_start_reminders.is_running(): 
             check_war_start_reminders.start()
             print("내전 시작 10분 전 알림 작업 시작됨.")
+        if not reconcile_war_notices_task.is_running():
+            reconcile_war_notices_task.start()
+            print("공지 재동기화 작업 시작됨.")
         print('봇이 준비되었습니다!')
     except Exception as e:
         print(f"동기화 중 오류 발생: {e}")
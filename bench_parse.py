@@ -0,0 +1,105 @@
+import random
+import sys
+import timeit
+from datetime import datetime, timedelta
+
+from time_parser import (
+    KST, parse_date_time_expression, parse_date_time_expression_uncached,
+    parse_time_string_to_datetime, parse_recruitment_end_datetime
+)
+
+# 사용법: python bench_parse.py [퍼징 횟수]
+# 검사는 assert 대신 AssertionError를 직접 발생시키므로 python -O로 실행해도 생략되지 않음
+
+KNOWN_CASES = {
+    "21:00": (None, None, 21, 0, 0),
+    "오후 9시 30분": (None, None, 21, 30, 0),
+    "9시 반": (None, None, 9, 30, 0),
+    "오전 12시": (None, None, 0, 0, 0),
+    "오후 12시": (None, None, 12, 0, 0),
+    "밤 12시": (None, None, 0, 0, 1),
+    "저녁 12시": (None, None, 0, 0, 1),
+    "밤 1시": (None, None, 1, 0, 1),
+    "밤 2시 30분": (None, None, 2, 30, 1),
+    "밤 5시": (None, None, 5, 0, 1),
+    "밤 11시": (None, None, 23, 0, 0),
+    "새벽 2시": (None, None, 2, 0, 0),
+    "토요일 밤 1시": ("weekday", (None, 5), 1, 0, 1),
+    "내일 오후 9시": ("relative", 1, 21, 0, 0),
+    "모레 21:30": ("relative", 2, 21, 30, 0),
+    "토요일 오후 9시": ("weekday", (None, 5), 21, 0, 0),
+    "다음 주 토요일 9시": ("weekday", (1, 5), 9, 0, 0),
+    "12/25 21:00": ("date", (None, 12, 25), 21, 0, 0),
+    "2025-12-25 오후 9시": ("date", (2025, 12, 25), 21, 0, 0),
+    "12월 25일 오후 9시 30분": ("date", (None, 12, 25), 21, 30, 0),
+    "2/30 21:00": None,
+    "25:00": None,
+    "내일": None,
+    "": None,
+}
+
+FUZZ_ALPHABET = "0123456789:/.-  시분반오전후밤저녁새벽아침내일모레글피오늘이번다음주월화수목금토일요"
+FUZZ_DATES = ["", "오늘 ", "내일 ", "모레 ", "글피 ", "이번 주 ", "다음 주 ", "토요일 ", "다음주 월요일 ", "12/25 ", "2/29 ",
+              "2025-02-29 ", "13/40 ", "12월 25일 ", "0/0 "]
+FUZZ_MERIDIEMS = ["", "오전 ", "오후 ", "밤 ", "새벽 ", "저녁 ", "아침 "]
+FUZZ_HOURS = ["0", "1", "3", "9", "12", "13", "23", "24", "99"]
+FUZZ_MINUTES = ["시", "시 반", "시 30분", "시 60분", ":00", ":59", ":60", ""]
+# (시작 시간, 모집 종료 입력) -> 모집 종료 시간: 시각만 입력하면 시작 시간 이전 중 가장 늦은 해당 시각
+RECRUITMENT_END_CASES = [
+    (datetime(2026, 10, 24, 1, 0, tzinfo=KST), "23:50", datetime(2026, 10, 23, 23, 50, tzinfo=KST)),
+    (datetime(2026, 10, 25, 0, 0, tzinfo=KST), "오후 11시", datetime(2026, 10, 24, 23, 0, tzinfo=KST)),
+    (datetime(2026, 10, 24, 21, 0, tzinfo=KST), "20:00", datetime(2026, 10, 24, 20, 0, tzinfo=KST)),
+    (datetime(2026, 10, 24, 21, 0, tzinfo=KST), "21:00", datetime(2026, 10, 24, 21, 0, tzinfo=KST)),
+]
+BENCH_INPUTS = ["21:00", "오후 9시 30분", "내일 오후 9시", "토요일 21:00", "다음 주 금요일 오후 8시", "12/25 21:00"]
+
+def check(condition: bool, message):
+    if not condition:
+        raise AssertionError(message)
+
+def check_known_cases():
+    for text, expected in KNOWN_CASES.items():
+        actual = parse_date_time_expression_uncached(text)
+        check(actual == expected, f"{text!r}: {actual} != {expected}")
+    # 밤 12시는 항상 다음 날 00시로 계산되어야 함
+    midnight = parse_time_string_to_datetime("밤 12시")
+    tomorrow = (datetime.now(KST) + timedelta(days=1)).date()
+    check(midnight.date() == tomorrow and midnight.hour == 0, midnight)
+    for start_datetime, text, expected in RECRUITMENT_END_CASES:
+        actual = parse_recruitment_end_datetime(text, start_datetime)
+        check(actual == expected, f"{start_datetime} / {text!r}: {actual} != {expected}")
+    print(f"알려진 입력 {len(KNOWN_CASES) + len(RECRUITMENT_END_CASES) + 1}개 확인 완료")
+
+def fuzz(iterations: int):
+    rng = random.Random(0)
+    matched = 0
+    for _ in range(iterations):
+        # 절반은 임의 문자열, 절반은 문법 구조(날짜 + 오전/오후 + 시각)를 따르는 조합으로 생성
+        if rng.random() < 0.5:
+            text = "".join(rng.choice(FUZZ_ALPHABET) for _ in range(rng.randint(0, 20)))
+        else:
+            text = rng.choice(FUZZ_DATES) + rng.choice(FUZZ_MERIDIEMS) + rng.choice(FUZZ_HOURS) + rng.choice(FUZZ_MINUTES)
+        parsed = parse_date_time_expression_uncached(text)
+        if parsed:
+            matched += 1
+            _, _, hour, minute, _ = parsed
+            check(0 <= hour < 24 and 0 <= minute < 60, (text, parsed))
+        # 캐시를 거친 결과는 캐시 없이 파싱한 결과와 같아야 함 (두 번째 호출은 캐시 적중)
+        check(parse_date_time_expression(text) == parsed, (text, parsed))
+        check(parse_date_time_expression(text) == parsed, (text, parsed))
+        # 예외 없이 None 또는 KST datetime을 돌려줘야 함
+        resolved = parse_time_string_to_datetime(text)
+        check(resolved is None or resolved.tzinfo is not None, (text, resolved))
+    print(f"퍼징 {iterations}회 완료 (문법 일치 {matched}회)")
+
+def bench():
+    rounds = 20000
+    for label, parse in (("캐시 없음", parse_date_time_expression_uncached), ("LRU 캐시", parse_date_time_expression)):
+        elapsed = timeit.timeit(lambda: [parse(text) for text in BENCH_INPUTS], number=rounds)
+        parses = rounds * len(BENCH_INPUTS)
+        print(f"{label}: {parses / elapsed:,.0f} parses/s ({elapsed:.3f}s / {parses}회)")
+
+if __name__ == "__main__":
+    check_known_cases()
+    fuzz(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
+    bench()
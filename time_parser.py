@@ -0,0 +1,138 @@
+import re
+from datetime import datetime, time, date, timezone, timedelta
+from functools import lru_cache
+
+# 한국 시간대(KST) 정의
+KST = timezone(timedelta(hours=9))
+
+# --- 날짜/시간 파싱 함수 ---
+# 문법은 모듈 로드 시 한 번만 컴파일: [날짜] [오전/오후] 시각
+# 날짜: 오늘/내일/모레/글피, (이번 주/다음 주) 토요일, 12/25, 2025-12-25, 12월 25일
+# 시각: 21:00, 9시, 9시 30분, 9시 반
+DATE_TIME_PATTERN = re.compile(r"""
+    ^\s*
+    (?:
+        (?P<relative_day>오늘|내일|모레|글피)
+      | (?:(?P<week>이번\s*주|다음\s*주|담주)\s*)?(?P<weekday>[월화수목금토일])요일
+      | (?:(?P<year>\d{4})[-./])?(?P<month>\d{1,2})[-./](?P<day>\d{1,2})
+      | (?P<month_kr>\d{1,2})\s*월\s*(?P<day_kr>\d{1,2})\s*일
+    )?
+    \s*
+    (?P<meridiem>오전|오후|아침|새벽|저녁|밤)?
+    \s*
+    (?:
+        (?P<hour>\d{1,2})\s*:\s*(?P<minute>\d{2})
+      | (?P<hour_kr>\d{1,2})\s*시\s*(?:(?P<minute_kr>\d{1,2})\s*분|(?P<half>반))?
+    )
+    \s*$
+""", re.VERBOSE)
+
+RELATIVE_DAY_OFFSETS = {"오늘": 0, "내일": 1, "모레": 2, "글피": 3}
+KOREAN_WEEKDAYS = "월화수목금토일"
+AM_MERIDIEMS = {"오전", "아침", "새벽"}
+PM_MERIDIEMS = {"오후", "저녁", "밤"}
+# "밤 12시", "저녁 12시"는 정오가 아니라 그날 자정(다음 날 00시)
+MIDNIGHT_MERIDIEMS = {"저녁", "밤"}
+# "밤 1시" ~ "밤 5시"는 다음 날 새벽
+LATE_NIGHT_MERIDIEM = "밤"
+LATE_NIGHT_HOURS = range(1, 6)
+
+def parse_date_time_expression_uncached(text: str) -> tuple | None:
+    # 현재 시각과 무관한 파싱 결과 -> (날짜 종류, 날짜 값, 시, 분, 추가 일수), 실제 날짜 계산은 resolve 단계에서 수행
+    match = DATE_TIME_PATTERN.match(text)
+    if not match:
+        return None
+
+    if match["hour"] is not None:
+        hour, minute = int(match["hour"]), int(match["minute"])
+    else:
+        hour = int(match["hour_kr"])
+        minute = 30 if match["half"] else int(match["minute_kr"] or 0)
+
+    day_shift = 0
+    if match["meridiem"] in MIDNIGHT_MERIDIEMS and hour == 12:
+        hour, day_shift = 0, 1
+    elif match["meridiem"] == LATE_NIGHT_MERIDIEM and hour in LATE_NIGHT_HOURS:
+        day_shift = 1
+    elif match["meridiem"] in PM_MERIDIEMS and hour < 12:
+        hour += 12
+    elif match["meridiem"] in AM_MERIDIEMS and hour == 12:
+        hour = 0
+    if not (0 <= hour < 24 and 0 <= minute < 60):
+        return None
+
+    if match["relative_day"]:
+        return ("relative", RELATIVE_DAY_OFFSETS[match["relative_day"]], hour, minute, day_shift)
+    if match["weekday"]:
+        week = match["week"].replace(" ", "") if match["week"] else None
+        week_offset = None if week is None else (0 if week == "이번주" else 1)
+        return ("weekday", (week_offset, KOREAN_WEEKDAYS.index(match["weekday"])), hour, minute, day_shift)
+    if match["month"] or match["month_kr"]:
+        year = int(match["year"]) if match["year"] else None
+        month = int(match["month"] or match["month_kr"])
+        day = int(match["day"] or match["day_kr"])
+        try:
+            date(year or 2000, month, day)  # 윤년 기준으로 날짜 유효성만 확인
+        except ValueError:
+            return None
+        return ("date", (year, month, day), hour, minute, day_shift)
+    return (None, None, hour, minute, day_shift)
+
+parse_date_time_expression = lru_cache(maxsize=512)(parse_date_time_expression_uncached)
+
+def parse_time_string_to_datetime(time_str: str, reference_date: date | None = None) -> datetime | None:
+    parsed = parse_date_time_expression(time_str)
+    if not parsed:
+        return None
+    date_kind, date_value, hour, minute, day_shift = parsed
+    parsed_time = time(hour, minute, tzinfo=KST)
+    shift = timedelta(days=day_shift)
+    # 현재 날짜도 KST 기준으로 가져옴
+    now_kst = datetime.now(KST)
+    today_kst = now_kst.date()
+
+    if date_kind == "relative":
+        return datetime.combine(today_kst + timedelta(days=date_value), parsed_time) + shift
+
+    if date_kind == "weekday":
+        week_offset, weekday_index = date_value
+        if week_offset is None:
+            # 요일만 입력한 경우 가장 가까운 해당 요일 (오늘이 그 요일이고 시간이 지났다면 다음 주)
+            dt_obj = datetime.combine(today_kst + timedelta(days=(weekday_index - today_kst.weekday()) % 7), parsed_time) + shift
+            if dt_obj < now_kst:
+                dt_obj += timedelta(days=7)
+            return dt_obj
+        this_monday = today_kst - timedelta(days=today_kst.weekday())
+        return datetime.combine(this_monday + timedelta(days=week_offset * 7 + weekday_index), parsed_time) + shift
+
+    if date_kind == "date":
+        year, month, day = date_value
+        try:
+            dt_obj = datetime.combine(date(year or today_kst.year, month, day), parsed_time) + shift
+            # 연도를 생략했고 이미 지난 날짜라면 내년으로
+            if year is None and dt_obj < now_kst:
+                dt_obj = datetime.combine(date(today_kst.year + 1, month, day), parsed_time) + shift
+        except ValueError:
+            return None
+        return dt_obj
+
+    if reference_date:
+        return datetime.combine(reference_date, parsed_time) + shift
+    # 날짜 없이 시각만 입력한 경우 가장 가까운 미래의 해당 시각 (밤 12시/밤 1시 등도 자연스럽게 다음 날로 계산됨)
+    dt_obj = datetime.combine(today_kst, parsed_time)
+    if dt_obj < now_kst:
+        dt_obj += timedelta(days=1)
+    return dt_obj
+
+def parse_recruitment_end_datetime(time_str: str, start_datetime: datetime | None) -> datetime | None:
+    # 날짜 없이 시각만 입력한 모집 종료 시간은 시작 시간 이전(또는 같은 시각) 중 가장 늦은 해당 시각으로 계산
+    parsed = parse_date_time_expression(time_str)
+    if parsed and parsed[0] is None and start_datetime:
+        dt_obj = parse_time_string_to_datetime(time_str, start_datetime.date())
+        if dt_obj > start_datetime:
+            dt_obj -= timedelta(days=1)
+        return dt_obj
+    return parse_time_string_to_datetime(time_str)
+
+def format_kst_datetime(dt_obj: datetime) -> str:
+    return f"{dt_obj.strftime('%Y-%m-%d')} ({KOREAN_WEEKDAYS[dt_obj.weekday()]}) {dt_obj.strftime('%H:%M')} KST"